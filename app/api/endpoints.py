@@ -5,7 +5,7 @@ Own thought process: Request/response handling and error management.
 """
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.schemas import (
@@ -26,7 +26,7 @@ router = APIRouter()
 
 
 @router.get("/fetch", response_model=ParagraphResponse)
-def fetch_endpoint(db: Session = Depends(get_db)):
+async def fetch_endpoint(db: AsyncSession = Depends(get_db)):
     """
     Fetch a paragraph from metaphorpsum.com and store it.
     
@@ -43,10 +43,10 @@ def fetch_endpoint(db: Session = Depends(get_db)):
     """
     try:
         # Fetch paragraph from external API
-        content = fetch_paragraph_from_api()
+        content = await fetch_paragraph_from_api()
         
         # Store in database
-        paragraph = store_paragraph(db, content)
+        paragraph = await store_paragraph(db, content)
         
         return paragraph
     except Exception as e:
@@ -54,9 +54,9 @@ def fetch_endpoint(db: Session = Depends(get_db)):
 
 
 @router.post("/search", response_model=SearchResponse)
-def search_endpoint(
+async def search_endpoint(
     search_request: SearchRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Search through stored paragraphs with multiple words and operators.
@@ -73,22 +73,24 @@ def search_endpoint(
         SearchResponse: Count and list of matching paragraphs
     """
     try:
-        paragraphs = search_paragraphs(
+        paragraphs = await search_paragraphs(
             db,
             search_request.words,
             search_request.operator
         )
         
-        return SearchResponse(
-            count=len(paragraphs),
-            paragraphs=paragraphs
-        )
+        # Plain dict: FastAPI validates it against SearchResponse once,
+        # instead of building models here that it would dump and re-validate
+        return {
+            "count": len(paragraphs),
+            "paragraphs": paragraphs
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/dictionary", response_model=DictionaryResponse)
-def dictionary_endpoint(db: Session = Depends(get_db)):
+async def dictionary_endpoint(db: AsyncSession = Depends(get_db)):
     """
     Get definitions of the top 10 most frequent words.
     
@@ -105,7 +107,7 @@ def dictionary_endpoint(db: Session = Depends(get_db)):
         HTTPException: If processing fails
     """
     try:
-        top_words_data = get_top_words_with_definitions(db, top_n=10)
+        top_words_data = await get_top_words_with_definitions(db, top_n=10)
         
         word_definitions = [
             WordDefinition(**word_data)
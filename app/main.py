@@ -3,20 +3,44 @@ Main FastAPI application entry point.
 AI-assisted: FastAPI application setup pattern from AI.
 Own thought process: CORS configuration and startup event handling.
 """
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.database import engine, Base
 from app.api.endpoints import router
+from app.redis_client import get_redis_client
+from app.services import http_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application startup/shutdown handling.
+    Creates database tables on startup and releases pooled
+    HTTP, Redis and database connections on shutdown.
+    """
+    # Create database tables
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    
+    yield
+    
+    await http_client.aclose()
+    await get_redis_client().close()
+    await engine.dispose()
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Paragraph Management API",
     description="API for fetching, storing, and searching paragraphs with word frequency analysis",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # orjson (Rust) encodes response bodies several times faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -33,7 +57,7 @@ app.include_router(router, tags=["paragraphs"])
 
 
 @app.get("/")
-def root():
+async def root():
     """Root endpoint with API information."""
     return {
         "message": "Paragraph Management API",
@@ -47,7 +71,7 @@ def root():
 
 
 @app.get("/health")
-def health_check():
+async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
 
@@ -2,11 +2,19 @@
 Database models for storing paragraphs.
 AI-assisted: Basic SQLAlchemy model structure from AI, indexing strategy is custom design.
 """
-from sqlalchemy import Column, Integer, Text, DateTime, Index
+from sqlalchemy import Column, Computed, Integer, Text, DateTime, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 
 from app.database import Base
 
+# Text search configuration used for the content_tsv column and its queries.
+# 'simple' lowercases without stemming or stop-word removal, so a DB search
+# matches exactly the same words as the Redis inverted index.
+TEXT_SEARCH_CONFIG = "simple"
+
 
 class Paragraph(Base):
     """
@@ -15,16 +23,42 @@ class Paragraph(Base):
     Attributes:
         id: Primary key
         content: The paragraph text content
+        content_tsv: Full-text search vector of content (PostgreSQL only)
         created_at: Timestamp when paragraph was stored
     """
     __tablename__ = "paragraphs"
 
     id = Column(Integer, primary_key=True, index=True)
     content = Column(Text, nullable=False)
+    # Generated (STORED) column on PostgreSQL, so it can never drift from
+    # content; plain unused column on SQLite (see _compile_computed_sqlite).
+    # Deferred so paragraph SELECTs don't ship the vector back to the app.
+    content_tsv = deferred(Column(
+        TSVECTOR().with_variant(Text(), "sqlite"),
+        Computed(f"to_tsvector('{TEXT_SEARCH_CONFIG}'::regconfig, content)", persisted=True)
+    ))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
-    # Add index for better search performance
+    # Keep server-generated values out of INSERT ... RETURNING: otherwise the
+    # Computed content_tsv is sent back on every insert (store_paragraph
+    # refreshes the row's plain columns instead)
+    __mapper_args__ = {"eager_defaults": False}
+
+    # GIN index turns word search into an index probe instead of a
+    # sequential ILIKE '%word%' scan over every paragraph
     __table_args__ = (
-        Index('idx_paragraph_content', 'content'),
+        Index(
+            'idx_paragraph_tsv',
+            'content_tsv',
+            postgresql_using='gin'
+        ).ddl_if(dialect='postgresql'),
     )
 
+
+@compiles(Computed, "sqlite")
+def _compile_computed_sqlite(element, compiler, **kw):
+    """
+    Drop the generated-column clause on SQLite, which has no to_tsvector().
+    The column stays a plain nullable one there (tests search with ILIKE).
+    """
+    return ""
@@ -1,101 +1,250 @@
 """
 Redis connection and client management.
-Own thought process: Redis connection pooling and ZSET operations for word frequency.
+Own thought process: Redis connection pooling and HASH operations for word frequency.
+Uses redis.asyncio so Redis round-trips never block the event loop.
 """
-import redis
-from typing import Optional
+import heapq
+import json
+import time
+from collections import defaultdict
+from datetime import datetime
+import redis.asyncio as redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+from typing import List, Optional
+from sqlalchemy import select
 from app.config import settings
 
 
 class RedisClient:
     """Redis client wrapper for word frequency tracking and inverted index."""
     
-    # Redis key for word frequency sorted set
-    WORD_FREQ_KEY = "word_frequencies"
+    # Redis key for word frequency hash (word -> count)
+    WORD_FREQ_KEY = "word_counts"
+    
+    # Redis key and TTL for the computed top-N cache (n -> JSON list of [word, count])
+    TOP_WORDS_CACHE_KEY = "word_counts:top"
+    TOP_WORDS_CACHE_TTL = 60
+    
+    # Upper bound on n for get_top_words (bounds heap and cached reply size)
+    MAX_TOP_WORDS = 10000
     
     # Redis key prefix for inverted index (word -> set of paragraph IDs)
     INVERTED_INDEX_PREFIX = "word_index:"
     
-    def __init__(self):
-        """Initialize Redis connection pool."""
+    # Redis key prefix and TTL for cached dictionary definitions
+    DEFINITION_CACHE_PREFIX = "word_def:"
+    DEFINITION_CACHE_TTL = 86400
+    
+    # Redis key prefix for cached paragraphs (id -> JSON {content, created_at}).
+    # Paragraphs are immutable once stored, so entries never expire.
+    PARAGRAPH_CACHE_PREFIX = "para:"
+    
+    # SCAN page size hint and batch size for multi-key commands
+    SCAN_COUNT = 1000
+    KEY_BATCH_SIZE = 500
+    
+    # Connection options shared by the client's own pool and injected pools
+    CONNECTION_OPTIONS = {
+        "decode_responses": True,
+        "socket_connect_timeout": 5,
+        "socket_timeout": 5,
+    }
+    
+    # Key constants that are scoped by the client's key prefix
+    NAMESPACED_KEYS = (
+        "WORD_FREQ_KEY",
+        "TOP_WORDS_CACHE_KEY",
+        "INVERTED_INDEX_PREFIX",
+        "DEFINITION_CACHE_PREFIX",
+        "PARAGRAPH_CACHE_PREFIX",
+    )
+    
+    # Backoff (seconds) between health probes while Redis is down
+    HEALTH_RETRY_MIN = 1.0
+    HEALTH_RETRY_MAX = 30.0
+    
+    def __init__(
+        self,
+        pool: Optional[redis.ConnectionPool] = None,
+        key_prefix: Optional[str] = None
+    ):
+        """
+        Initialize Redis connection pool.
+        
+        Args:
+            pool: Optional existing connection pool to share (created with
+                CONNECTION_OPTIONS); by default the client opens its own
+            key_prefix: Prefix for every key this client touches, so several
+                apps (or parallel test workers) can share one Redis;
+                defaults to settings.redis_key_prefix
+        """
         self.client: Optional[redis.Redis] = None
+        self._pool = pool
+        if key_prefix is None:
+            key_prefix = settings.redis_key_prefix
+        if key_prefix:
+            for name in self.NAMESPACED_KEYS:
+                setattr(self, name, f"{key_prefix}{getattr(self, name)}")
+        # Cached health state: probed lazily, cleared by connection errors
+        self._healthy = False
+        self._retry_at = 0.0
+        self._retry_delay = self.HEALTH_RETRY_MIN
         self._connect()
     
     def _connect(self):
-        """Establish Redis connection."""
+        """
+        Create the Redis client.
+        Connections are opened lazily by the pool on first command,
+        so there is nothing to await here.
+        """
         try:
-            self.client = redis.from_url(
-                settings.redis_url,
-                decode_responses=True,
-                socket_connect_timeout=5,
-                socket_timeout=5
-            )
-            # Test connection
-            self.client.ping()
+            if self._pool is not None:
+                self.client = redis.Redis(connection_pool=self._pool)
+            else:
+                self.client = redis.from_url(settings.redis_url, **self.CONNECTION_OPTIONS)
         except Exception as e:
             print(f"Warning: Could not connect to Redis: {e}")
             self.client = None
     
-    def is_available(self) -> bool:
-        """Check if Redis is available."""
+    async def is_available(self) -> bool:
+        """
+        Check if Redis is available.
+        Own optimization: Returns the cached health state instead of sending a
+        PING before every command. Only while unhealthy is Redis re-probed,
+        at most once per backoff interval (doubling up to HEALTH_RETRY_MAX).
+        """
         if self.client is None:
             return False
-        try:
-            self.client.ping()
+        if self._healthy:
             return True
-        except:
+        if time.monotonic() < self._retry_at:
             return False
+        
+        try:
+            await self.client.ping()
+            self._healthy = True
+            self._retry_delay = self.HEALTH_RETRY_MIN
+        except Exception:
+            self._mark_unhealthy()
+        return self._healthy
+    
+    def _mark_unhealthy(self) -> None:
+        """Mark Redis as down and schedule the next health probe."""
+        if self._healthy:
+            self._retry_delay = self.HEALTH_RETRY_MIN
+        else:
+            self._retry_delay = min(self._retry_delay * 2, self.HEALTH_RETRY_MAX)
+        self._healthy = False
+        self._retry_at = time.monotonic() + self._retry_delay
     
-    def increment_word_frequencies(self, words: dict) -> None:
+    def _record_failure(self, error: Exception) -> None:
+        """Drop the cached health state if a command failed to reach Redis."""
+        if isinstance(error, (RedisConnectionError, RedisTimeoutError)):
+            self._mark_unhealthy()
+    
+    async def close(self) -> None:
+        """Close all pooled Redis connections."""
+        if self.client is None:
+            return
+        
+        try:
+            await self.client.aclose()
+        except Exception as e:
+            print(f"Error closing Redis connection: {e}")
+    
+    async def increment_word_frequencies(self, words: dict) -> None:
         """
-        Increment word frequencies in Redis ZSET.
-        Own design: Uses ZINCRBY for atomic increments.
+        Increment word frequencies in Redis HASH.
+        Own design: Uses HINCRBY for O(1) atomic increments (no sorted-set
+        skiplist maintenance on the write path). The cached top-N is left to
+        expire (TOP_WORDS_CACHE_TTL) rather than dropped on every write.
         
         Args:
             words: Dictionary with word as key and count as value
         """
-        if not self.is_available():
+        # Nothing to write: skip the round-trip
+        if not words or not await self.is_available():
             return
         
         try:
-            # Use pipeline for efficiency
-            pipe = self.client.pipeline()
-            for word, count in words.items():
-                pipe.zincrby(self.WORD_FREQ_KEY, count, word)
-            pipe.execute()
+            # Use pipeline for efficiency: one round-trip for the whole batch
+            pipe = self.client.pipeline(transaction=False)
+            self._queue_word_frequencies(pipe, words)
+            await pipe.execute()
         except Exception as e:
+            self._record_failure(e)
             print(f"Error updating Redis word frequencies: {e}")
     
-    def get_top_words(self, n: int = 10) -> list:
+    def _queue_word_frequencies(self, pipe, words: dict) -> None:
+        """Queue one HINCRBY per word on a pipeline."""
+        # Bind the key and method once instead of per word
+        key = self.WORD_FREQ_KEY
+        hincrby = pipe.hincrby
+        for word, count in words.items():
+            hincrby(key, word, count)
+    
+    async def get_top_words(self, n: int = 10) -> list:
         """
-        Get top N words by frequency from Redis ZSET.
-        Own design: Uses ZREVRANGE with scores for efficient retrieval.
+        Get top N words by frequency from Redis HASH.
+        Own design: Top-N is computed on read with a heap and cached for
+        TOP_WORDS_CACHE_TTL seconds, since it is read far less often than
+        counts are written. Counts written meanwhile show up once it expires,
+        so the O(vocabulary) HSCAN pass runs at most once per TTL.
+        Own optimization: The hash is read with HSCAN pages into a size-n heap,
+        so neither Redis nor the app ever holds the whole hash as one reply.
         
         Args:
-            n: Number of top words to retrieve
+            n: Number of top words to retrieve (capped at MAX_TOP_WORDS)
             
         Returns:
             List of tuples (word, frequency)
         """
-        if not self.is_available():
+        n = min(n, self.MAX_TOP_WORDS)
+        if n <= 0 or not await self.is_available():
             return []
         
         try:
-            # ZREVRANGE returns in descending order (highest scores first)
-            # WITHSCORES returns tuples of (word, score)
-            results = self.client.zrevrange(
-                self.WORD_FREQ_KEY, 
-                0, 
-                n - 1, 
-                withscores=True
-            )
-            # Convert scores to integers
-            return [(word, int(score)) for word, score in results]
+            cached = await self.client.hget(self.TOP_WORDS_CACHE_KEY, str(n))
+            if cached is not None:
+                return [(word, count) for word, count in json.loads(cached)]
+            
+            # Min-heap of the n largest (count, word) pairs seen so far.
+            # HSCAN may return a field more than once (e.g. while the hash
+            # rehashes), so words already in the heap are skipped.
+            heap = []
+            in_heap = set()
+            async for word, count in self.client.hscan_iter(
+                self.WORD_FREQ_KEY,
+                count=self.SCAN_COUNT
+            ):
+                if word in in_heap:
+                    continue
+                item = (int(count), word)
+                if len(heap) < n:
+                    heapq.heappush(heap, item)
+                    in_heap.add(word)
+                elif item > heap[0]:
+                    in_heap.discard(heapq.heapreplace(heap, item)[1])
+                    in_heap.add(word)
+            
+            # Highest count first, ties broken by word descending (same order as ZREVRANGE)
+            results = [(word, count) for count, word in sorted(heap, reverse=True)]
+            
+            if results:
+                pipe = self.client.pipeline(transaction=False)
+                pipe.hset(self.TOP_WORDS_CACHE_KEY, str(n), json.dumps(results))
+                # NX: caching another n must not extend the entries already cached
+                pipe.expire(self.TOP_WORDS_CACHE_KEY, self.TOP_WORDS_CACHE_TTL, nx=True)
+                await pipe.execute()
+            
+            return results
         except Exception as e:
+            self._record_failure(e)
             print(f"Error getting top words from Redis: {e}")
             return []
     
-    def get_word_frequency(self, word: str) -> int:
+    async def get_word_frequency(self, word: str) -> int:
         """
         Get frequency of a specific word.
         
@@ -105,107 +254,339 @@ class RedisClient:
         Returns:
             Frequency count (0 if not found)
         """
-        if not self.is_available():
-            return 0
+        frequencies = await self.get_word_frequencies([word])
+        return frequencies.get(word, 0)
+    
+    async def get_word_frequencies(self, words: List[str]) -> dict:
+        """
+        Get frequencies of several words at once.
+        Own optimization: One HMGET (one round-trip) instead of an HGET per word.
+        
+        Args:
+            words: The words to look up
+            
+        Returns:
+            Dictionary of word -> frequency count (0 if not found)
+        """
+        if not await self.is_available() or not words:
+            return {word: 0 for word in words}
         
         try:
-            score = self.client.zscore(self.WORD_FREQ_KEY, word)
-            return int(score) if score is not None else 0
+            counts = await self.client.hmget(self.WORD_FREQ_KEY, words)
+            return {
+                word: int(count) if count is not None else 0
+                for word, count in zip(words, counts)
+            }
         except Exception as e:
-            print(f"Error getting word frequency: {e}")
-            return 0
+            self._record_failure(e)
+            print(f"Error getting word frequencies: {e}")
+            return {word: 0 for word in words}
     
-    def clear_word_frequencies(self) -> None:
+    async def clear_word_frequencies(self) -> None:
         """
         Clear all word frequencies.
         Useful for testing or reset.
         """
-        if not self.is_available():
+        if not await self.is_available():
             return
         
         try:
-            self.client.delete(self.WORD_FREQ_KEY)
+            await self.client.delete(self.WORD_FREQ_KEY, self.TOP_WORDS_CACHE_KEY)
         except Exception as e:
+            self._record_failure(e)
             print(f"Error clearing word frequencies: {e}")
     
-    def rebuild_word_frequencies_from_db(self, db_session) -> None:
+    async def rebuild_word_frequencies_from_db(self, db_session) -> None:
         """
         Rebuild Redis word frequencies from database.
         Useful for initialization or recovery.
         Own design: Fallback mechanism if Redis data is lost.
         
         Args:
-            db_session: SQLAlchemy database session
+            db_session: SQLAlchemy async database session
         """
-        if not self.is_available():
+        if not await self.is_available():
             return
         
         try:
-            from app.models import Paragraph
-            from app.services import extract_words_from_text
-            from collections import Counter
-            
-            # Clear existing data
-            self.clear_word_frequencies()
-            
-            # Get all paragraphs
-            paragraphs = db_session.query(Paragraph).all()
+            from app.services import get_word_frequencies
             
-            # Count all words
-            all_words = []
-            for paragraph in paragraphs:
-                words = extract_words_from_text(paragraph.content)
-                all_words.extend(words)
+            # Count all words (aggregated in SQL on PostgreSQL, streamed otherwise)
+            word_counts = await get_word_frequencies(db_session)
             
-            word_counts = Counter(all_words)
+            # Clear existing data
+            await self.clear_word_frequencies()
             
-            # Update Redis
+            # Update Redis: the hash is empty, so counts are written with
+            # multi-field HSETs (KEY_BATCH_SIZE words each) in one pipeline
             if word_counts:
-                self.increment_word_frequencies(dict(word_counts))
+                items = list(word_counts.items())
+                pipe = self.client.pipeline(transaction=False)
+                for start in range(0, len(items), self.KEY_BATCH_SIZE):
+                    pipe.hset(
+                        self.WORD_FREQ_KEY,
+                        mapping=dict(items[start:start + self.KEY_BATCH_SIZE])
+                    )
+                await pipe.execute()
             
             print(f"Rebuilt Redis word frequencies: {len(word_counts)} unique words")
         except Exception as e:
+            self._record_failure(e)
             print(f"Error rebuilding word frequencies: {e}")
     
+    # ========== COMBINED WRITE METHODS ==========
+    
+    async def record_paragraph(
+        self,
+        paragraph_id: int,
+        word_counts: dict,
+        paragraph: Optional[dict] = None
+    ) -> None:
+        """
+        Record a new paragraph in word frequencies, inverted index and,
+        optionally, the paragraph cache.
+        Own optimization: A single pipeline (one round-trip) instead of one
+        for increment_word_frequencies plus one for add_to_inverted_index.
+        
+        Args:
+            paragraph_id: ID of the paragraph
+            word_counts: Dictionary with word as key and count as value
+                (its keys double as the paragraph's unique words)
+            paragraph: Optional paragraph dict (see cache_paragraphs) to cache
+        """
+        if not await self.is_available():
+            return
+        
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            self._queue_word_frequencies(pipe, word_counts)
+            self._queue_index_add(pipe, paragraph_id, word_counts)
+            if paragraph is not None:
+                pipe.set(
+                    f"{self.PARAGRAPH_CACHE_PREFIX}{paragraph_id}",
+                    self._encode_paragraph(paragraph)
+                )
+            await pipe.execute()
+        except Exception as e:
+            self._record_failure(e)
+            print(f"Error recording paragraph in Redis: {e}")
+    
+    # ========== PARAGRAPH CACHE METHODS ==========
+    # Own design: Lets search answer from Redis alone, without a DB round-trip
+    
+    @staticmethod
+    def _encode_paragraph(paragraph: dict) -> str:
+        """Serialize a paragraph dict (id, content, created_at) to JSON."""
+        created_at = paragraph["created_at"]
+        return json.dumps({
+            "content": paragraph["content"],
+            "created_at": created_at.isoformat() if created_at is not None else None,
+        })
+    
+    async def get_cached_paragraphs(self, paragraph_ids) -> dict:
+        """
+        Get cached paragraphs by ID.
+        Own optimization: MGET in batches of KEY_BATCH_SIZE, all batches in
+        one pipelined round-trip.
+        
+        Args:
+            paragraph_ids: IDs to look up
+            
+        Returns:
+            Dict of id -> {"id", "content", "created_at"} for the IDs found;
+            missing IDs are left out
+        """
+        if not await self.is_available():
+            return {}
+        
+        try:
+            ids = list(paragraph_ids)
+            prefix = self.PARAGRAPH_CACHE_PREFIX
+            pipe = self.client.pipeline(transaction=False)
+            for start in range(0, len(ids), self.KEY_BATCH_SIZE):
+                pipe.mget([f"{prefix}{pid}" for pid in ids[start:start + self.KEY_BATCH_SIZE]])
+            batches = await pipe.execute()
+            
+            paragraphs = {}
+            values = (value for batch in batches for value in batch)
+            for pid, value in zip(ids, values):
+                if value is None:
+                    continue
+                data = json.loads(value)
+                created_at = data["created_at"]
+                paragraphs[pid] = {
+                    "id": pid,
+                    "content": data["content"],
+                    "created_at": datetime.fromisoformat(created_at) if created_at else None,
+                }
+            return paragraphs
+        except Exception as e:
+            self._record_failure(e)
+            print(f"Error reading cached paragraphs: {e}")
+            return {}
+    
+    async def cache_paragraphs(self, paragraphs: List[dict]) -> None:
+        """
+        Cache paragraphs for search results.
+        
+        Args:
+            paragraphs: Dicts with "id", "content" and "created_at"
+        """
+        if not await self.is_available() or not paragraphs:
+            return
+        
+        try:
+            await self.client.mset({
+                f"{self.PARAGRAPH_CACHE_PREFIX}{paragraph['id']}": self._encode_paragraph(paragraph)
+                for paragraph in paragraphs
+            })
+        except Exception as e:
+            self._record_failure(e)
+            print(f"Error caching paragraphs: {e}")
+    
+    async def clear_paragraph_cache(self) -> None:
+        """
+        Clear all cached paragraphs.
+        Useful for testing or reset.
+        """
+        if not await self.is_available():
+            return
+        
+        try:
+            async for keys in self._scan_keys(f"{self.PARAGRAPH_CACHE_PREFIX}*"):
+                await self.client.unlink(*keys)
+        except Exception as e:
+            self._record_failure(e)
+            print(f"Error clearing paragraph cache: {e}")
+    
+    # ========== DEFINITION CACHE METHODS ==========
+    # Own design: Shares dictionary API results across processes
+    
+    async def get_cached_definition(self, word: str) -> Optional[List[str]]:
+        """
+        Get cached dictionary definitions for a word.
+        
+        Args:
+            word: The word to look up
+            
+        Returns:
+            List of definitions, or None if not cached
+        """
+        cached = await self.get_cached_definitions([word])
+        return cached.get(word)
+    
+    async def get_cached_definitions(self, words: List[str]) -> dict:
+        """
+        Get cached dictionary definitions for several words.
+        Own optimization: One MGET (one round-trip) instead of a GET per word.
+        
+        Args:
+            words: The words to look up
+            
+        Returns:
+            Dict of word -> list of definitions for the cached words;
+            words that are not cached are left out
+        """
+        if not words or not await self.is_available():
+            return {}
+        
+        try:
+            prefix = self.DEFINITION_CACHE_PREFIX
+            values = await self.client.mget([f"{prefix}{word}" for word in words])
+            return {
+                word: json.loads(value)
+                for word, value in zip(words, values)
+                if value is not None
+            }
+        except Exception as e:
+            self._record_failure(e)
+            print(f"Error reading cached definitions: {e}")
+            return {}
+    
+    async def cache_definition(self, word: str, definitions: List[str]) -> None:
+        """
+        Cache dictionary definitions for a word.
+        
+        Args:
+            word: The word the definitions belong to
+            definitions: List of definitions to cache
+        """
+        await self.cache_definitions({word: definitions})
+    
+    async def cache_definitions(self, definitions: dict) -> None:
+        """
+        Cache dictionary definitions for several words.
+        Own design: SETEX so entries expire and pick up dictionary updates,
+        all pipelined in one round-trip.
+        
+        Args:
+            definitions: Dict of word -> list of definitions to cache
+        """
+        if not definitions or not await self.is_available():
+            return
+        
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            prefix = self.DEFINITION_CACHE_PREFIX
+            ttl = self.DEFINITION_CACHE_TTL
+            for word, word_definitions in definitions.items():
+                pipe.setex(f"{prefix}{word}", ttl, json.dumps(word_definitions))
+            await pipe.execute()
+        except Exception as e:
+            self._record_failure(e)
+            print(f"Error caching definitions: {e}")
+    
     # ========== INVERTED INDEX METHODS ==========
     # Own design: Inverted index for O(1) word lookup in paragraph search
     
-    def add_to_inverted_index(self, paragraph_id: int, words: list) -> None:
+    async def add_to_inverted_index(self, paragraph_id: int, words: list) -> None:
         """
         Add paragraph to inverted index for all its words.
-        Own design: Uses Redis SADD for efficient set operations.
+        Own design: Uses Redis SADD for efficient set operations, one per
+        unique word, all in a single pipelined round-trip.
         
         For each unique word in the paragraph, we store the paragraph ID
         in a set: word_index:{word} -> {paragraph_id1, paragraph_id2, ...}
         
         Args:
             paragraph_id: ID of the paragraph
-            words: List of words in the paragraph
+            words: List of words in the paragraph, already normalized
+                (lowercase) by the tokenizer; they are not lowercased again
         """
-        if not self.is_available():
+        if not words or not await self.is_available():
             return
         
         try:
+            pipe = self.client.pipeline(transaction=False)
             # Get unique words
-            unique_words = set(words)
-            
-            # Use pipeline for efficiency
-            pipe = self.client.pipeline()
-            for word in unique_words:
-                key = f"{self.INVERTED_INDEX_PREFIX}{word}"
-                pipe.sadd(key, paragraph_id)
-            pipe.execute()
+            self._queue_index_add(pipe, paragraph_id, set(words))
+            await pipe.execute()
         except Exception as e:
+            self._record_failure(e)
             print(f"Error adding to inverted index: {e}")
     
-    def search_inverted_index(self, words: list, operator: str = "or") -> set:
+    def _queue_index_add(self, pipe, paragraph_id: int, unique_words) -> None:
+        """
+        Queue one SADD per unique word on a pipeline.
+        Plain SADDs share the pipeline's round-trip; a Lua script queued on
+        a pipeline would make execute() send a blocking SCRIPT EXISTS first.
+        """
+        prefix = self.INVERTED_INDEX_PREFIX
+        sadd = pipe.sadd
+        for word in unique_words:
+            sadd(f"{prefix}{word}", paragraph_id)
+    
+    async def search_inverted_index(self, words: list, operator: str = "or") -> set:
         """
         Search inverted index for paragraphs containing words.
         Own design: Uses Redis set operations (SUNION/SINTER) for optimal performance.
+        The merge runs server-side; only the resulting IDs are transferred.
         
         Time Complexity:
         - OR operation: O(N) where N = total matching paragraph IDs
         - AND operation: O(N*M) where N = smallest set, M = number of words
+          (O(M) key lookups and no intersection work when any word is not
+          indexed: SINTER looks up every key, then returns empty)
         
         Args:
             words: List of words to search for
@@ -214,27 +595,35 @@ class RedisClient:
         Returns:
             Set of paragraph IDs that match the search
         """
-        if not self.is_available() or not words:
+        if not await self.is_available() or not words:
             return set()
         
         try:
-            # Get keys for all search words
-            keys = [f"{self.INVERTED_INDEX_PREFIX}{word.lower()}" for word in words]
+            # Get keys for all search words (deduplicated: repeated or
+            # differently-cased words would make Redis merge the same set twice).
+            # Indexed words are lowercase already, so only the query is normalized.
+            prefix = self.INVERTED_INDEX_PREFIX
+            keys = list(dict.fromkeys(prefix + word.lower() for word in words))
             
             if operator == "or":
                 # Union: paragraphs containing at least one word
-                result = self.client.sunion(keys)
+                result = await self.client.sunion(keys)
             else:  # operator == "and"
-                # Intersection: paragraphs containing all words
-                result = self.client.sinter(keys)
+                # Intersection: paragraphs containing all words.
+                # SINTER itself sorts the sets by size and probes from the
+                # smallest, and skips the intersection when any key is missing
+                # (after one lookup per key), so no SCARD pre-pass (an extra
+                # round-trip) is needed to order the keys
+                result = await self.client.sinter(keys)
             
             # Convert string IDs to integers
             return {int(pid) for pid in result}
         except Exception as e:
+            self._record_failure(e)
             print(f"Error searching inverted index: {e}")
             return set()
     
-    def remove_from_inverted_index(self, paragraph_id: int, words: list) -> None:
+    async def remove_from_inverted_index(self, paragraph_id: int, words: list) -> None:
         """
         Remove paragraph from inverted index.
         Useful for paragraph deletion.
@@ -243,68 +632,118 @@ class RedisClient:
             paragraph_id: ID of the paragraph to remove
             words: List of words in the paragraph
         """
-        if not self.is_available():
+        if not words or not await self.is_available():
             return
         
         try:
+            # One pipelined SREM per unique word, a single round-trip
             unique_words = set(words)
-            pipe = self.client.pipeline()
+            pipe = self.client.pipeline(transaction=False)
+            prefix = self.INVERTED_INDEX_PREFIX
+            srem = pipe.srem
             for word in unique_words:
-                key = f"{self.INVERTED_INDEX_PREFIX}{word}"
-                pipe.srem(key, paragraph_id)
-            pipe.execute()
+                srem(f"{prefix}{word}", paragraph_id)
+            await pipe.execute()
         except Exception as e:
+            self._record_failure(e)
             print(f"Error removing from inverted index: {e}")
     
-    def clear_inverted_index(self) -> None:
+    async def clear_inverted_index(self) -> None:
         """
         Clear entire inverted index.
         Useful for testing or rebuild.
         """
-        if not self.is_available():
+        if not await self.is_available():
             return
         
         try:
-            # Find all inverted index keys
-            pattern = f"{self.INVERTED_INDEX_PREFIX}*"
-            keys = self.client.keys(pattern)
-            
-            if keys:
-                self.client.delete(*keys)
+            # Incremental SCAN instead of KEYS (which blocks Redis for the whole
+            # keyspace); UNLINK frees the sets in a background thread
+            async for keys in self._scan_inverted_index_keys():
+                await self.client.unlink(*keys)
         except Exception as e:
+            self._record_failure(e)
             print(f"Error clearing inverted index: {e}")
     
-    def rebuild_inverted_index_from_db(self, db_session) -> None:
+    async def clear_all(self) -> None:
+        """
+        Clear word frequencies, inverted index and paragraph cache at once.
+        Own optimization: SCAN batches are queued as UNLINKs on one pipeline,
+        sent in a single round-trip; UNLINK frees memory in the background.
+        Cached definitions are kept (they expire on their own).
+        Useful for testing or reset.
+        """
+        if not await self.is_available():
+            return
+        
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for prefix in (self.INVERTED_INDEX_PREFIX, self.PARAGRAPH_CACHE_PREFIX):
+                async for keys in self._scan_keys(f"{prefix}*"):
+                    pipe.unlink(*keys)
+            pipe.unlink(self.WORD_FREQ_KEY, self.TOP_WORDS_CACHE_KEY)
+            await pipe.execute()
+        except Exception as e:
+            self._record_failure(e)
+            print(f"Error clearing Redis data: {e}")
+    
+    async def rebuild_inverted_index_from_db(self, db_session) -> None:
         """
         Rebuild entire inverted index from database.
         Own design: Recovery mechanism for inverted index.
+        Own optimization: O(unique words per batch) variadic SADDs instead of
+        one SADD per word per paragraph.
         
         Args:
-            db_session: SQLAlchemy database session
+            db_session: SQLAlchemy async database session
         """
-        if not self.is_available():
+        if not await self.is_available():
             return
         
         try:
             from app.models import Paragraph
-            from app.services import extract_words_from_text
+            from app.services import extract_words_from_text, STREAM_BATCH_SIZE
             
             # Clear existing inverted index
-            self.clear_inverted_index()
+            await self.clear_inverted_index()
             
-            # Get all paragraphs
-            paragraphs = db_session.query(Paragraph).all()
+            # Stream paragraphs instead of loading the whole table into memory,
+            # as a Core statement on the session's connection (no ORM row processing)
+            paragraphs = Paragraph.__table__
+            conn = await db_session.connection()
+            result = await conn.stream(
+                select(paragraphs.c.id, paragraphs.c.content)
+                .execution_options(yield_per=STREAM_BATCH_SIZE)
+            )
             
-            # Rebuild index for each paragraph
-            for paragraph in paragraphs:
-                words = extract_words_from_text(paragraph.content)
-                self.add_to_inverted_index(paragraph.id, words)
+            # Rebuild index one streamed batch (one pipeline) at a time.
+            # Paragraph IDs are grouped by word first, so each word in the batch
+            # gets one variadic SADD instead of one SADD per (word, paragraph).
+            prefix = self.INVERTED_INDEX_PREFIX
+            total_paragraphs = 0
+            async for rows in result.partitions():
+                word_to_ids = defaultdict(list)
+                for paragraph_id, content in rows:
+                    for word in set(extract_words_from_text(content)):
+                        word_to_ids[word].append(paragraph_id)
+                
+                pipe = self.client.pipeline(transaction=False)
+                sadd = pipe.sadd
+                # Chunked so a larger STREAM_BATCH_SIZE can't build oversized commands
+                chunk = self.KEY_BATCH_SIZE
+                for word, paragraph_ids in word_to_ids.items():
+                    key = f"{prefix}{word}"
+                    for start in range(0, len(paragraph_ids), chunk):
+                        sadd(key, *paragraph_ids[start:start + chunk])
+                await pipe.execute()
+                total_paragraphs += len(rows)
             
-            print(f"Rebuilt inverted index for {len(paragraphs)} paragraphs")
+            print(f"Rebuilt inverted index for {total_paragraphs} paragraphs")
         except Exception as e:
+            self._record_failure(e)
             print(f"Error rebuilding inverted index: {e}")
     
-    def get_inverted_index_stats(self) -> dict:
+    async def get_inverted_index_stats(self) -> dict:
         """
         Get statistics about the inverted index.
         Useful for monitoring and debugging.
@@ -312,15 +751,21 @@ class RedisClient:
         Returns:
             Dictionary with index statistics
         """
-        if not self.is_available():
+        if not await self.is_available():
             return {}
         
         try:
-            pattern = f"{self.INVERTED_INDEX_PREFIX}*"
-            keys = self.client.keys(pattern)
+            total_words = 0
+            total_mappings = 0
             
-            total_words = len(keys)
-            total_mappings = sum(self.client.scard(key) for key in keys) if keys else 0
+            # SCARD each batch of scanned keys in one pipelined round-trip
+            async for keys in self._scan_inverted_index_keys():
+                pipe = self.client.pipeline(transaction=False)
+                for key in keys:
+                    pipe.scard(key)
+                sizes = await pipe.execute()
+                total_words += len(keys)
+                total_mappings += sum(sizes)
             
             return {
                 "total_indexed_words": total_words,
@@ -328,8 +773,62 @@ class RedisClient:
                 "average_paragraphs_per_word": total_mappings / total_words if total_words > 0 else 0
             }
         except Exception as e:
+            self._record_failure(e)
             print(f"Error getting index stats: {e}")
             return {}
+    
+    async def has_inverted_index(self) -> bool:
+        """
+        Check whether the inverted index holds any words.
+        Stops at the first key found instead of scanning the whole index.
+        
+        Returns:
+            True if at least one word is indexed
+        """
+        if not await self.is_available():
+            return False
+        
+        try:
+            # scan_iter directly: _scan_inverted_index_keys holds keys back until
+            # it has a full batch, which would walk the whole keyspace for a small index
+            async for _ in self.client.scan_iter(
+                match=f"{self.INVERTED_INDEX_PREFIX}*",
+                count=self.SCAN_COUNT
+            ):
+                return True
+            return False
+        except Exception as e:
+            self._record_failure(e)
+            print(f"Error checking inverted index: {e}")
+            return False
+    
+    def _scan_inverted_index_keys(self):
+        """
+        Iterate inverted index keys with SCAN, in batches of KEY_BATCH_SIZE.
+        
+        Yields:
+            Lists of inverted index keys
+        """
+        return self._scan_keys(f"{self.INVERTED_INDEX_PREFIX}*")
+    
+    async def _scan_keys(self, match: str):
+        """
+        Iterate keys matching a pattern with SCAN, in batches of KEY_BATCH_SIZE.
+        
+        Args:
+            match: SCAN MATCH pattern
+            
+        Yields:
+            Lists of matching keys
+        """
+        batch = []
+        async for key in self.client.scan_iter(match=match, count=self.SCAN_COUNT):
+            batch.append(key)
+            if len(batch) >= self.KEY_BATCH_SIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
 
 
 # Global Redis client instance
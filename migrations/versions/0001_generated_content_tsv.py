@@ -0,0 +1,59 @@
+"""Make content_tsv a generated tsvector column with a GIN index
+
+Brings databases created by earlier versions up to the current schema:
+- baseline tables (no content_tsv, btree idx_paragraph_content on content)
+- trigger-maintained content_tsv (paragraphs_content_tsv_update)
+Databases created by the current create_all already match and are left as is.
+Adding a STORED generated column rewrites the table, so run it off-peak on
+large tables.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-14 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Superseded by the generated column and the GIN index
+    op.execute("DROP TRIGGER IF EXISTS paragraphs_content_tsv_update ON paragraphs")
+    op.execute("DROP INDEX IF EXISTS idx_paragraph_content")
+    
+    # A trigger-maintained column can't be turned into a generated one in
+    # place, so it is dropped (with its index) and added back as generated
+    op.execute("""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_schema = current_schema()
+                  AND table_name = 'paragraphs'
+                  AND column_name = 'content_tsv'
+                  AND is_generated = 'ALWAYS'
+            ) THEN
+                ALTER TABLE paragraphs DROP COLUMN IF EXISTS content_tsv;
+                ALTER TABLE paragraphs ADD COLUMN content_tsv tsvector
+                    GENERATED ALWAYS AS (to_tsvector('simple'::regconfig, content)) STORED;
+            END IF;
+        END $$
+    """)
+    
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_paragraph_tsv ON paragraphs USING gin (content_tsv)"
+    )
+
+
+def downgrade() -> None:
+    # Back to the baseline schema (dropping the column drops its GIN index)
+    op.execute("ALTER TABLE paragraphs DROP COLUMN IF EXISTS content_tsv")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_paragraph_content ON paragraphs (content)")
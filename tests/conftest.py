@@ -4,68 +4,195 @@ AI-assisted: Basic pytest fixture pattern from AI.
 Own thought process: Test database setup and cleanup strategy.
 Redis integration: Own design for test isolation with Redis.
 """
+import asyncio
+import os
+
+# Per-worker isolation under pytest-xdist ("main" when run serially): set
+# before the app is imported so its global Redis client picks it up
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "main")
+os.environ["REDIS_KEY_PREFIX"] = f"test:{WORKER_ID}:"
+
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from fastapi.testclient import TestClient
+import redis.asyncio as redis
+from httpx import AsyncClient
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
 from app.database import Base, get_db
 from app.main import app
-from app.redis_client import get_redis_client
+from app.models import Paragraph
+from app.config import settings
+from app.redis_client import RedisClient, get_redis_client
+
+# Use file-based SQLite (aiosqlite driver) for testing, one file per worker
+SQLALCHEMY_DATABASE_URL = f"sqlite+aiosqlite:///./test_{WORKER_ID}.db"
+
+engine = create_async_engine(SQLALCHEMY_DATABASE_URL)
+
+
+# pysqlite's implicit transaction handling breaks SAVEPOINT; let SQLAlchemy
+# emit BEGIN itself so each test can run inside a rolled-back transaction
+@event.listens_for(engine.sync_engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine.sync_engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """
+    Share one event loop across the whole test session.
+    The global Redis/HTTP clients pool connections that are bound to the
+    loop they were opened on, so every test must run on the same loop.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+async def database():
+    """Create the schema once for the whole session."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest.fixture(scope="function")
+async def db_session(database):
+    """
+    Give each test a session inside a transaction that is rolled back after it.
+    Own thought process: Commits in the code under test only release a
+    SAVEPOINT, so every test starts from an empty database without
+    recreating the schema.
+    """
+    async with database.connect() as conn:
+        transaction = await conn.begin()
+        db = AsyncSession(
+            bind=conn,
+            join_transaction_mode="create_savepoint",
+            autoflush=False,
+            expire_on_commit=False
+        )
+        try:
+            yield db
+        finally:
+            await db.close()
+            await transaction.rollback()
+
+
+@pytest.fixture(scope="function")
+def seed(db_session):
+    """
+    Insert paragraphs with one executemany INSERT and commit.
+    Usage: await seed(["first paragraph", "second paragraph"])
+    """
+    async def _seed(contents):
+        await db_session.execute(
+            insert(Paragraph),
+            [{"content": content} for content in contents]
+        )
+        await db_session.commit()
+    return _seed
 
-# Use in-memory SQLite for testing
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}
-)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def _async_stub(monkeypatch, target: str) -> dict:
+    """
+    Replace an async function with a stub configured through a dict:
+    set "return_value" or "side_effect" (an exception to raise).
+    """
+    stub = {"return_value": None, "side_effect": None}
+    
+    async def fake(*args, **kwargs):
+        if stub["side_effect"] is not None:
+            raise stub["side_effect"]
+        return stub["return_value"]
+    
+    monkeypatch.setattr(target, fake)
+    return stub
+
+
+@pytest.fixture(scope="function")
+def fetch_stub(monkeypatch):
+    """
+    Stub the Metaphorpsum fetch where /fetch looks it up.
+    The endpoint module imports the function by name, so patching
+    app.services would leave the real HTTP call in place.
+    """
+    return _async_stub(monkeypatch, "app.api.endpoints.fetch_paragraph_from_api")
 
 
 @pytest.fixture(scope="function")
-def db_session():
-    """Create a fresh database for each test."""
-    Base.metadata.create_all(bind=engine)
-    db = TestingSessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-        Base.metadata.drop_all(bind=engine)
+def definition_stub(monkeypatch):
+    """
+    Stub dictionary lookups (cache + API) used by /dictionary.
+    "return_value" is the definitions returned for every word.
+    """
+    stub = {"return_value": None, "side_effect": None}
+    
+    async def fake(words):
+        if stub["side_effect"] is not None:
+            raise stub["side_effect"]
+        return [stub["return_value"]] * len(words)
+    
+    monkeypatch.setattr("app.services.get_word_definitions", fake)
+    return stub
+
+
+@pytest.fixture(scope="session")
+async def redis_pool():
+    """
+    One Redis connection pool for the whole session.
+    Tests reuse its connections instead of connecting per RedisClient.
+    """
+    pool = redis.ConnectionPool.from_url(
+        settings.redis_url,
+        max_connections=32,
+        **RedisClient.CONNECTION_OPTIONS
+    )
+    yield pool
+    await pool.disconnect()
 
 
 @pytest.fixture(scope="function")
-def redis_client():
-    """Create a Redis client and clean it before/after tests."""
-    client = get_redis_client()
-    if client.is_available():
-        client.clear_word_frequencies()
+async def redis_client(redis_pool):
+    """Create a Redis client on the shared pool and clean it before/after tests."""
+    client = RedisClient(pool=redis_pool)
+    await client.clear_all()
     yield client
-    if client.is_available():
-        client.clear_word_frequencies()
+    await client.clear_all()
+
+
+@pytest.fixture(scope="session")
+async def http_client():
+    """One HTTP client bound to the app for the whole session."""
+    async with AsyncClient(app=app, base_url="http://test") as test_client:
+        yield test_client
 
 
 @pytest.fixture(scope="function")
-def client(db_session):
-    """Create a test client with a test database."""
-    def override_get_db():
+async def client(http_client, db_session):
+    """Point the shared test client at this test's database session."""
+    async def override_get_db():
         try:
             yield db_session
         finally:
             pass
-    
+
     # Clean Redis before test
-    redis = get_redis_client()
-    if redis.is_available():
-        redis.clear_word_frequencies()
-    
+    redis_client = get_redis_client()
+    await redis_client.clear_all()
+
     app.dependency_overrides[get_db] = override_get_db
-    with TestClient(app) as test_client:
-        yield test_client
+    yield http_client
     app.dependency_overrides.clear()
-    
-    # Clean Redis after test
-    if redis.is_available():
-        redis.clear_word_frequencies()
 
+    # Clean Redis after test
+    await redis_client.clear_all()
@@ -2,21 +2,16 @@
 Integration tests for API endpoints.
 Own thought process: End-to-end testing strategy for all endpoints.
 """
-import pytest
-from unittest.mock import patch, MagicMock
-
-from app.models import Paragraph
 
 
 class TestFetchEndpoint:
     """Tests for /fetch endpoint."""
     
-    @patch('app.services.fetch_paragraph_from_api')
-    def test_fetch_endpoint_success(self, mock_fetch, client):
+    async def test_fetch_endpoint_success(self, fetch_stub, client):
         """Test successful paragraph fetching."""
-        mock_fetch.return_value = "This is a test paragraph with multiple words."
+        fetch_stub["return_value"] = "This is a test paragraph with multiple words."
         
-        response = client.get("/fetch")
+        response = await client.get("/fetch")
         assert response.status_code == 200
         data = response.json()
         assert "id" in data
@@ -24,28 +19,50 @@ class TestFetchEndpoint:
         assert "created_at" in data
         assert data["content"] == "This is a test paragraph with multiple words."
     
-    @patch('app.services.fetch_paragraph_from_api')
-    def test_fetch_endpoint_failure(self, mock_fetch, client):
+    async def test_fetch_does_not_return_tsvector(self, fetch_stub, client, db_session):
+        """Test that the INSERT doesn't send the generated content_tsv back."""
+        from sqlalchemy import event
+        
+        fetch_stub["return_value"] = "A paragraph for the insert statement."
+        statements = []
+        
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+        
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = await client.get("/fetch")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        
+        assert response.status_code == 200
+        assert response.json()["created_at"] is not None
+        inserts = [statement for statement in statements if statement.startswith("INSERT")]
+        assert len(inserts) == 1
+        assert "content_tsv" not in inserts[0]
+    
+    async def test_fetch_endpoint_failure(self, fetch_stub, client):
         """Test fetch endpoint error handling."""
-        mock_fetch.side_effect = Exception("API Error")
+        fetch_stub["side_effect"] = Exception("API Error")
         
-        response = client.get("/fetch")
+        response = await client.get("/fetch")
         assert response.status_code == 500
 
 
 class TestSearchEndpoint:
     """Tests for /search endpoint."""
     
-    def test_search_or_operator(self, client, db_session):
+    async def test_search_or_operator(self, client, seed):
         """Test search with OR operator."""
         # Add test data
-        p1 = Paragraph(content="The quick brown fox")
-        p2 = Paragraph(content="The lazy dog")
-        p3 = Paragraph(content="A different story")
-        db_session.add_all([p1, p2, p3])
-        db_session.commit()
+        await seed([
+            "The quick brown fox",
+            "The lazy dog",
+            "A different story",
+        ])
         
-        response = client.post(
+        response = await client.post(
             "/search",
             json={"words": ["fox", "dog"], "operator": "or"}
         )
@@ -54,16 +71,16 @@ class TestSearchEndpoint:
         assert data["count"] == 2
         assert len(data["paragraphs"]) == 2
     
-    def test_search_and_operator(self, client, db_session):
+    async def test_search_and_operator(self, client, seed):
         """Test search with AND operator."""
         # Add test data
-        p1 = Paragraph(content="The fox and the dog are friends")
-        p2 = Paragraph(content="The fox runs fast")
-        p3 = Paragraph(content="The dog barks loud")
-        db_session.add_all([p1, p2, p3])
-        db_session.commit()
+        await seed([
+            "The fox and the dog are friends",
+            "The fox runs fast",
+            "The dog barks loud",
+        ])
         
-        response = client.post(
+        response = await client.post(
             "/search",
             json={"words": ["fox", "dog"], "operator": "and"}
         )
@@ -72,13 +89,11 @@ class TestSearchEndpoint:
         assert data["count"] == 1
         assert "fox and the dog" in data["paragraphs"][0]["content"]
     
-    def test_search_no_results(self, client, db_session):
+    async def test_search_no_results(self, client, seed):
         """Test search with no matching results."""
-        p1 = Paragraph(content="The quick brown fox")
-        db_session.add(p1)
-        db_session.commit()
+        await seed(["The quick brown fox"])
         
-        response = client.post(
+        response = await client.post(
             "/search",
             json={"words": ["elephant", "zebra"], "operator": "or"}
         )
@@ -87,17 +102,17 @@ class TestSearchEndpoint:
         assert data["count"] == 0
         assert len(data["paragraphs"]) == 0
     
-    def test_search_invalid_operator(self, client):
+    async def test_search_invalid_operator(self, client):
         """Test search with invalid operator."""
-        response = client.post(
+        response = await client.post(
             "/search",
             json={"words": ["test"], "operator": "invalid"}
         )
         assert response.status_code == 422  # Validation error
     
-    def test_search_empty_words(self, client):
+    async def test_search_empty_words(self, client):
         """Test search with empty words list."""
-        response = client.post(
+        response = await client.post(
             "/search",
             json={"words": [], "operator": "or"}
         )
@@ -107,19 +122,18 @@ class TestSearchEndpoint:
 class TestDictionaryEndpoint:
     """Tests for /dictionary endpoint."""
     
-    @patch('app.services.get_word_definition')
-    def test_dictionary_endpoint(self, mock_definition, client, db_session):
+    async def test_dictionary_endpoint(self, definition_stub, client, seed):
         """Test dictionary endpoint with mock definitions."""
         # Add test data with repeated words
-        p1 = Paragraph(content="hello world hello test")
-        p2 = Paragraph(content="world test world hello")
-        db_session.add_all([p1, p2])
-        db_session.commit()
+        await seed([
+            "hello world hello test",
+            "world test world hello",
+        ])
         
         # Mock definition responses
-        mock_definition.return_value = ["A test definition"]
+        definition_stub["return_value"] = ["A test definition"]
         
-        response = client.get("/dictionary")
+        response = await client.get("/dictionary")
         assert response.status_code == 200
         data = response.json()
         assert "top_words" in data
@@ -131,24 +145,43 @@ class TestDictionaryEndpoint:
             assert "frequency" in word_data
             assert "definitions" in word_data
     
-    def test_dictionary_empty_database(self, client, db_session):
+    async def test_dictionary_non_json_definition_response(self, client, seed, monkeypatch):
+        """Test that a non-JSON dictionary API response counts as no definition."""
+        from collections import OrderedDict
+        import httpx
+        
+        await seed(["zyzzyva zyzzyva quokka"])
+        
+        async def fake_get(url, *args, **kwargs):
+            return httpx.Response(
+                200, text="<html>Service unavailable</html>", request=httpx.Request("GET", url)
+            )
+        
+        monkeypatch.setattr("app.services.http_client.get", fake_get)
+        monkeypatch.setattr("app.services._definition_cache", OrderedDict())
+        
+        response = await client.get("/dictionary")
+        assert response.status_code == 200
+        top_words = response.json()["top_words"]
+        assert [word_data["word"] for word_data in top_words] == ["zyzzyva", "quokka"]
+        for word_data in top_words:
+            assert word_data["definitions"] == ["Definition not found"]
+    
+    async def test_dictionary_empty_database(self, client, db_session):
         """Test dictionary endpoint with no paragraphs."""
-        response = client.get("/dictionary")
+        response = await client.get("/dictionary")
         assert response.status_code == 200
         data = response.json()
         assert len(data["top_words"]) == 0
     
-    @patch('app.services.get_word_definition')
-    def test_dictionary_word_order(self, mock_definition, client, db_session):
+    async def test_dictionary_word_order(self, definition_stub, client, seed):
         """Test that words are ordered by frequency."""
         # Create content with known frequencies
-        p1 = Paragraph(content="apple apple apple banana banana cherry")
-        db_session.add(p1)
-        db_session.commit()
+        await seed(["apple apple apple banana banana cherry"])
         
-        mock_definition.return_value = ["A definition"]
+        definition_stub["return_value"] = ["A definition"]
         
-        response = client.get("/dictionary")
+        response = await client.get("/dictionary")
         assert response.status_code == 200
         data = response.json()
         
@@ -162,17 +195,17 @@ class TestDictionaryEndpoint:
 class TestRootEndpoints:
     """Tests for root and health endpoints."""
     
-    def test_root_endpoint(self, client):
+    async def test_root_endpoint(self, client):
         """Test root endpoint."""
-        response = client.get("/")
+        response = await client.get("/")
         assert response.status_code == 200
         data = response.json()
         assert "message" in data
         assert "endpoints" in data
     
-    def test_health_endpoint(self, client):
+    async def test_health_endpoint(self, client):
         """Test health check endpoint."""
-        response = client.get("/health")
+        response = await client.get("/health")
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
@@ -1,55 +1,46 @@
 """
 Unit tests for Redis word frequency tracking.
-Own thought process: Test Redis ZSET operations and fallback behavior.
+Own thought process: Test Redis word frequency operations and fallback behavior.
 """
-import pytest
-from unittest.mock import patch, MagicMock
+from datetime import datetime
 
-from app.redis_client import RedisClient
-from app.models import Paragraph
+import pytest
 
 
 class TestRedisClient:
     """Tests for Redis client functionality."""
     
-    def test_increment_word_frequencies(self):
+    async def test_increment_word_frequencies(self, redis_client):
         """Test incrementing word frequencies in Redis."""
-        redis_client = RedisClient()
         
-        if not redis_client.is_available():
+        if not await redis_client.is_available():
             pytest.skip("Redis not available")
         
-        # Clear existing data
-        redis_client.clear_word_frequencies()
-        
         # Add some words
         words = {"hello": 3, "world": 2, "test": 1}
-        redis_client.increment_word_frequencies(words)
+        await redis_client.increment_word_frequencies(words)
         
         # Verify frequencies
-        assert redis_client.get_word_frequency("hello") == 3
-        assert redis_client.get_word_frequency("world") == 2
-        assert redis_client.get_word_frequency("test") == 1
+        assert await redis_client.get_word_frequencies(["hello", "world", "test"]) == {
+            "hello": 3, "world": 2, "test": 1
+        }
         
         # Increment again
-        redis_client.increment_word_frequencies({"hello": 2, "python": 5})
-        
-        # Verify updated frequencies
-        assert redis_client.get_word_frequency("hello") == 5
-        assert redis_client.get_word_frequency("python") == 5
+        await redis_client.increment_word_frequencies({"hello": 2, "python": 5})
         
-        # Cleanup
-        redis_client.clear_word_frequencies()
+        # Verify updated frequencies (unknown words count as 0)
+        assert await redis_client.get_word_frequencies(["hello", "python", "missing"]) == {
+            "hello": 5, "python": 5, "missing": 0
+        }
+        assert await redis_client.get_word_frequency("hello") == 5
     
-    def test_get_top_words(self):
+    async def test_get_top_words(self, redis_client):
         """Test retrieving top words by frequency."""
-        redis_client = RedisClient()
         
-        if not redis_client.is_available():
+        if not await redis_client.is_available():
             pytest.skip("Redis not available")
         
-        # Clear and add test data
-        redis_client.clear_word_frequencies()
+        # Add test data
         words = {
             "apple": 10,
             "banana": 8,
@@ -57,247 +48,461 @@ class TestRedisClient:
             "date": 4,
             "elderberry": 2
         }
-        redis_client.increment_word_frequencies(words)
+        await redis_client.increment_word_frequencies(words)
         
         # Get top 3
-        top_words = redis_client.get_top_words(3)
+        top_words = await redis_client.get_top_words(3)
         assert len(top_words) == 3
         assert top_words[0] == ("apple", 10)
         assert top_words[1] == ("banana", 8)
         assert top_words[2] == ("cherry", 6)
         
-        # Cleanup
-        redis_client.clear_word_frequencies()
+        # Increments don't invalidate the cached top words; they expire instead
+        await redis_client.increment_word_frequencies({"date": 10})
+        assert (await redis_client.get_top_words(3))[0] == ("apple", 10)
+        ttl = await redis_client.client.ttl(redis_client.TOP_WORDS_CACHE_KEY)
+        assert 0 < ttl <= redis_client.TOP_WORDS_CACHE_TTL
+        
+        # Once expired, the top words are recomputed from the hash
+        await redis_client.client.delete(redis_client.TOP_WORDS_CACHE_KEY)
+        top_words = await redis_client.get_top_words(3)
+        assert top_words[0] == ("date", 14)
+        assert top_words[1] == ("apple", 10)
+        
+        # n larger than the vocabulary returns every word; n <= 0 returns none
+        assert len(await redis_client.get_top_words(100)) == 5
+        assert await redis_client.get_top_words(0) == []
     
-    def test_clear_word_frequencies(self):
+    async def test_get_top_words_skips_duplicate_hscan_entries(self, redis_client, monkeypatch):
+        """Test that a field returned twice by HSCAN is only counted once."""
+        
+        if not await redis_client.is_available():
+            pytest.skip("Redis not available")
+        
+        async def hscan_iter(*args, **kwargs):
+            for item in [("apple", "10"), ("banana", "8"), ("apple", "10"), ("cherry", "6")]:
+                yield item
+        
+        monkeypatch.setattr(redis_client.client, "hscan_iter", hscan_iter)
+        
+        assert await redis_client.get_top_words(3) == [("apple", 10), ("banana", 8), ("cherry", 6)]
+    
+    async def test_clear_word_frequencies(self, redis_client):
         """Test clearing all word frequencies."""
-        redis_client = RedisClient()
         
-        if not redis_client.is_available():
+        if not await redis_client.is_available():
             pytest.skip("Redis not available")
         
         # Add data
-        redis_client.increment_word_frequencies({"test": 5})
-        assert redis_client.get_word_frequency("test") == 5
+        await redis_client.increment_word_frequencies({"test": 5})
+        assert await redis_client.get_word_frequency("test") == 5
         
         # Clear
-        redis_client.clear_word_frequencies()
-        assert redis_client.get_word_frequency("test") == 0
-        assert redis_client.get_top_words(10) == []
+        await redis_client.clear_word_frequencies()
+        assert await redis_client.get_word_frequency("test") == 0
+        assert await redis_client.get_top_words(10) == []
     
-    def test_rebuild_from_database(self, db_session):
+    async def test_rebuild_from_database(self, redis_client, db_session, seed):
         """Test rebuilding Redis data from database."""
-        redis_client = RedisClient()
         
-        if not redis_client.is_available():
+        if not await redis_client.is_available():
             pytest.skip("Redis not available")
         
-        # Clear Redis
-        redis_client.clear_word_frequencies()
-        
         # Add paragraphs to database
-        p1 = Paragraph(content="hello world hello test")
-        p2 = Paragraph(content="world python world")
-        db_session.add_all([p1, p2])
-        db_session.commit()
+        await seed([
+            "hello world hello test",
+            "world python world",
+        ])
         
         # Rebuild from database
-        redis_client.rebuild_word_frequencies_from_db(db_session)
+        await redis_client.rebuild_word_frequencies_from_db(db_session)
         
         # Verify frequencies
-        assert redis_client.get_word_frequency("world") == 3
-        assert redis_client.get_word_frequency("hello") == 2
+        assert await redis_client.get_word_frequency("world") == 3
+        assert await redis_client.get_word_frequency("hello") == 2
+    
+    async def test_definition_cache(self, redis_client):
+        """Test caching dictionary definitions in Redis."""
+        
+        if not await redis_client.is_available():
+            pytest.skip("Redis not available")
+        
+        # Clear cached entry
+        await redis_client.client.delete(f"{redis_client.DEFINITION_CACHE_PREFIX}hello")
+        assert await redis_client.get_cached_definition("hello") is None
+        
+        # Cache and read back
+        await redis_client.cache_definition("hello", ["A greeting", "An exclamation"])
+        assert await redis_client.get_cached_definition("hello") == ["A greeting", "An exclamation"]
+        
+        # Entries expire
+        ttl = await redis_client.client.ttl(f"{redis_client.DEFINITION_CACHE_PREFIX}hello")
+        assert 0 < ttl <= redis_client.DEFINITION_CACHE_TTL
         
         # Cleanup
-        redis_client.clear_word_frequencies()
+        await redis_client.client.delete(f"{redis_client.DEFINITION_CACHE_PREFIX}hello")
     
-    def test_graceful_degradation_when_redis_unavailable(self):
+    async def test_health_state_is_cached(self, redis_client):
+        """Test that a connection error marks Redis down until the next probe."""
+        from redis.exceptions import ConnectionError as RedisConnectionError
+        
+        if not await redis_client.is_available():
+            pytest.skip("Redis not available")
+        
+        # A connection error disables Redis without re-probing
+        redis_client._record_failure(RedisConnectionError("connection lost"))
+        assert await redis_client.is_available() is False
+        
+        # Once the backoff has elapsed, Redis is probed again
+        redis_client._retry_at = 0.0
+        assert await redis_client.is_available() is True
+    
+    async def test_graceful_degradation_when_redis_unavailable(self, redis_client):
         """Test that app works when Redis is unavailable."""
-        redis_client = RedisClient()
         
         # Mock Redis to be unavailable
         redis_client.client = None
         
         # These should not raise exceptions
-        assert redis_client.is_available() is False
-        redis_client.increment_word_frequencies({"test": 1})
-        assert redis_client.get_top_words(10) == []
-        assert redis_client.get_word_frequency("test") == 0
-        redis_client.clear_word_frequencies()  # Should not crash
+        assert await redis_client.is_available() is False
+        await redis_client.increment_word_frequencies({"test": 1})
+        assert await redis_client.get_top_words(10) == []
+        assert await redis_client.get_word_frequency("test") == 0
+        assert await redis_client.get_word_frequencies(["test"]) == {"test": 0}
+        await redis_client.clear_word_frequencies()  # Should not crash
+        assert await redis_client.get_cached_definition("test") is None
+        await redis_client.cache_definition("test", ["A definition"])  # Should not crash
 
 
 class TestInvertedIndex:
     """Tests for inverted index functionality."""
     
-    def test_add_to_inverted_index(self):
+    async def test_add_to_inverted_index(self, redis_client):
         """Test adding paragraphs to inverted index."""
-        redis_client = RedisClient()
         
-        if not redis_client.is_available():
+        if not await redis_client.is_available():
             pytest.skip("Redis not available")
         
-        # Clear index
-        redis_client.clear_inverted_index()
-        
         # Add paragraph 1 with words
-        redis_client.add_to_inverted_index(1, ["hello", "world", "test"])
+        await redis_client.add_to_inverted_index(1, ["hello", "world", "test"])
         
         # Add paragraph 2 with overlapping words
-        redis_client.add_to_inverted_index(2, ["hello", "python", "code"])
+        await redis_client.add_to_inverted_index(2, ["hello", "python", "code"])
         
         # Search for "hello" - should return both paragraphs
-        results = redis_client.search_inverted_index(["hello"], "or")
+        results = await redis_client.search_inverted_index(["hello"], "or")
         assert 1 in results
         assert 2 in results
         assert len(results) == 2
+    
+    async def test_record_paragraph(self, redis_client):
+        """Test recording a paragraph in word frequencies and inverted index at once."""
         
-        # Cleanup
-        redis_client.clear_inverted_index()
+        if not await redis_client.is_available():
+            pytest.skip("Redis not available")
+        
+        await redis_client.record_paragraph(1, {"hello": 2, "world": 1})
+        await redis_client.record_paragraph(2, {"hello": 1})
+        
+        # Word frequencies updated
+        assert await redis_client.get_word_frequency("hello") == 3
+        assert await redis_client.get_word_frequency("world") == 1
+        
+        # Inverted index updated
+        assert await redis_client.search_inverted_index(["hello"], "or") == {1, 2}
+        assert await redis_client.search_inverted_index(["world"], "or") == {1}
     
-    def test_search_with_or_operator(self):
-        """Test inverted index search with OR operator."""
-        redis_client = RedisClient()
+    async def test_record_paragraph_single_round_trip(self, redis_client, monkeypatch):
+        """Test that recording a paragraph sends exactly one packet to Redis."""
+        from redis.asyncio.connection import Connection
+    
+        if not await redis_client.is_available():
+            pytest.skip("Redis not available")
+    
+        sent = []
+        send_packed_command = Connection.send_packed_command
+    
+        async def counting_send(self, command, *args, **kwargs):
+            sent.append(command)
+            return await send_packed_command(self, command, *args, **kwargs)
+    
+        monkeypatch.setattr(Connection, "send_packed_command", counting_send)
+        await redis_client.record_paragraph(
+            1, {"hello": 2, "world": 1}, {"id": 1, "content": "Hello world.", "created_at": None}
+        )
+        monkeypatch.undo()
+    
+        assert len(sent) == 1
+        assert await redis_client.search_inverted_index(["hello", "world"], "and") == {1}
+    
+    async def test_paragraph_cache(self, redis_client):
+        """Test caching paragraphs and reading them back with MGET."""
         
-        if not redis_client.is_available():
+        if not await redis_client.is_available():
             pytest.skip("Redis not available")
         
-        redis_client.clear_inverted_index()
+        created_at = datetime(2024, 1, 1, 12, 0, 0)
+        
+        await redis_client.record_paragraph(
+            1, {"hello": 1}, {"id": 1, "content": "Hello.", "created_at": created_at}
+        )
+        await redis_client.cache_paragraphs(
+            [{"id": 2, "content": "World.", "created_at": created_at}]
+        )
+        
+        cached = await redis_client.get_cached_paragraphs([1, 2, 3])
+        assert set(cached) == {1, 2}
+        assert cached[1] == {"id": 1, "content": "Hello.", "created_at": created_at}
+        assert cached[2]["content"] == "World."
+        
+        await redis_client.clear_paragraph_cache()
+        assert await redis_client.get_cached_paragraphs([1, 2]) == {}
+    
+    async def test_search_with_or_operator(self, redis_client):
+        """Test inverted index search with OR operator."""
+        
+        if not await redis_client.is_available():
+            pytest.skip("Redis not available")
         
         # Add test data
-        redis_client.add_to_inverted_index(1, ["apple", "banana"])
-        redis_client.add_to_inverted_index(2, ["cherry", "date"])
-        redis_client.add_to_inverted_index(3, ["apple", "cherry"])
+        await redis_client.add_to_inverted_index(1, ["apple", "banana"])
+        await redis_client.add_to_inverted_index(2, ["cherry", "date"])
+        await redis_client.add_to_inverted_index(3, ["apple", "cherry"])
         
         # Search with OR - at least one word must match
-        results = redis_client.search_inverted_index(["apple", "cherry"], "or")
+        results = await redis_client.search_inverted_index(["apple", "cherry"], "or")
         assert len(results) == 3  # All three paragraphs contain at least one word
         assert 1 in results
         assert 2 in results
         assert 3 in results
-        
-        redis_client.clear_inverted_index()
     
-    def test_search_with_and_operator(self):
+    async def test_search_with_and_operator(self, redis_client):
         """Test inverted index search with AND operator."""
-        redis_client = RedisClient()
         
-        if not redis_client.is_available():
+        if not await redis_client.is_available():
             pytest.skip("Redis not available")
         
-        redis_client.clear_inverted_index()
-        
         # Add test data
-        redis_client.add_to_inverted_index(1, ["apple", "banana"])
-        redis_client.add_to_inverted_index(2, ["cherry", "date"])
-        redis_client.add_to_inverted_index(3, ["apple", "cherry"])
+        await redis_client.add_to_inverted_index(1, ["apple", "banana"])
+        await redis_client.add_to_inverted_index(2, ["cherry", "date"])
+        await redis_client.add_to_inverted_index(3, ["apple", "cherry"])
         
         # Search with AND - all words must match
-        results = redis_client.search_inverted_index(["apple", "cherry"], "and")
+        results = await redis_client.search_inverted_index(["apple", "cherry"], "and")
         assert len(results) == 1  # Only paragraph 3 has both words
         assert 3 in results
         
-        redis_client.clear_inverted_index()
+        # A word missing from the index empties an AND and is ignored by an OR
+        assert await redis_client.search_inverted_index(["apple", "missing"], "and") == set()
+        assert await redis_client.search_inverted_index(["apple", "missing"], "or") == {1, 3}
     
-    def test_remove_from_inverted_index(self):
+    async def test_remove_from_inverted_index(self, redis_client):
         """Test removing paragraphs from inverted index."""
-        redis_client = RedisClient()
         
-        if not redis_client.is_available():
+        if not await redis_client.is_available():
             pytest.skip("Redis not available")
         
-        redis_client.clear_inverted_index()
-        
         # Add paragraphs
-        redis_client.add_to_inverted_index(1, ["hello", "world"])
-        redis_client.add_to_inverted_index(2, ["hello", "python"])
+        await redis_client.add_to_inverted_index(1, ["hello", "world"])
+        await redis_client.add_to_inverted_index(2, ["hello", "python"])
         
         # Verify both exist
-        results = redis_client.search_inverted_index(["hello"], "or")
+        results = await redis_client.search_inverted_index(["hello"], "or")
         assert len(results) == 2
         
         # Remove paragraph 1
-        redis_client.remove_from_inverted_index(1, ["hello", "world"])
+        await redis_client.remove_from_inverted_index(1, ["hello", "world"])
         
         # Verify only paragraph 2 remains
-        results = redis_client.search_inverted_index(["hello"], "or")
+        results = await redis_client.search_inverted_index(["hello"], "or")
         assert len(results) == 1
         assert 2 in results
-        
-        redis_client.clear_inverted_index()
     
-    def test_rebuild_inverted_index_from_db(self, db_session):
+    async def test_rebuild_inverted_index_from_db(self, redis_client, db_session, seed):
         """Test rebuilding inverted index from database."""
-        redis_client = RedisClient()
         
-        if not redis_client.is_available():
+        if not await redis_client.is_available():
             pytest.skip("Redis not available")
         
-        redis_client.clear_inverted_index()
-        
         # Add paragraphs to database
-        p1 = Paragraph(content="hello world python")
-        p2 = Paragraph(content="hello programming code")
-        p3 = Paragraph(content="world of technology")
-        db_session.add_all([p1, p2, p3])
-        db_session.commit()
+        await seed([
+            "hello world python",
+            "hello programming code",
+            "world of technology",
+        ])
         
         # Rebuild index
-        redis_client.rebuild_inverted_index_from_db(db_session)
+        await redis_client.rebuild_inverted_index_from_db(db_session)
         
         # Test searches
-        results = redis_client.search_inverted_index(["hello"], "or")
+        results = await redis_client.search_inverted_index(["hello"], "or")
         assert len(results) == 2  # p1 and p2
         
-        results = redis_client.search_inverted_index(["world"], "or")
+        results = await redis_client.search_inverted_index(["world"], "or")
         assert len(results) == 2  # p1 and p3
         
-        results = redis_client.search_inverted_index(["hello", "world"], "and")
+        results = await redis_client.search_inverted_index(["hello", "world"], "and")
         assert len(results) == 1  # Only p1
+    
+    async def test_rebuild_inverted_index_across_batches(
+        self, redis_client, db_session, seed, monkeypatch
+    ):
+        """Test that grouping IDs by word per streamed batch keeps every ID."""
+        
+        if not await redis_client.is_available():
+            pytest.skip("Redis not available")
+        
+        # Small batches and chunks so words span several batches and SADDs
+        monkeypatch.setattr("app.services.STREAM_BATCH_SIZE", 3)
+        monkeypatch.setattr(redis_client, "KEY_BATCH_SIZE", 2)
+        await seed([("common alpha", "common beta")[i % 2] for i in range(7)])
+        
+        await redis_client.rebuild_inverted_index_from_db(db_session)
         
-        redis_client.clear_inverted_index()
+        assert len(await redis_client.search_inverted_index(["common"], "or")) == 7
+        assert len(await redis_client.search_inverted_index(["alpha"], "or")) == 4
+        assert len(await redis_client.search_inverted_index(["common", "beta"], "and")) == 3
     
-    def test_inverted_index_stats(self):
+    async def test_inverted_index_stats(self, redis_client):
         """Test getting inverted index statistics."""
-        redis_client = RedisClient()
         
-        if not redis_client.is_available():
+        if not await redis_client.is_available():
             pytest.skip("Redis not available")
         
-        redis_client.clear_inverted_index()
+        assert await redis_client.has_inverted_index() is False
         
         # Add some data
-        redis_client.add_to_inverted_index(1, ["apple", "banana", "cherry"])
-        redis_client.add_to_inverted_index(2, ["apple", "date"])
-        redis_client.add_to_inverted_index(3, ["banana"])
+        await redis_client.add_to_inverted_index(1, ["apple", "banana", "cherry"])
+        await redis_client.add_to_inverted_index(2, ["apple", "date"])
+        await redis_client.add_to_inverted_index(3, ["banana"])
         
         # Get stats
-        stats = redis_client.get_inverted_index_stats()
+        stats = await redis_client.get_inverted_index_stats()
         
         assert stats["total_indexed_words"] == 4  # apple, banana, cherry, date
         assert stats["total_word_paragraph_mappings"] == 6  # Total mappings
+        assert await redis_client.has_inverted_index() is True
+    
+    async def test_clear_all(self, redis_client):
+        """Test clearing frequencies, index and paragraph cache in one call."""
+        
+        if not await redis_client.is_available():
+            pytest.skip("Redis not available")
         
-        redis_client.clear_inverted_index()
+        await redis_client.record_paragraph(
+            1, {"hello": 1}, {"id": 1, "content": "Hello.", "created_at": None}
+        )
+        assert await redis_client.has_inverted_index() is True
+        
+        await redis_client.clear_all()
+        
+        assert await redis_client.get_word_frequency("hello") == 0
+        assert await redis_client.has_inverted_index() is False
+        assert await redis_client.get_cached_paragraphs([1]) == {}
     
-    def test_case_insensitive_search(self):
+    async def test_case_insensitive_search(self, redis_client):
         """Test that inverted index search is case-insensitive."""
-        redis_client = RedisClient()
         
-        if not redis_client.is_available():
+        if not await redis_client.is_available():
             pytest.skip("Redis not available")
         
-        redis_client.clear_inverted_index()
-        
         # Add with lowercase
-        redis_client.add_to_inverted_index(1, ["hello", "world"])
+        await redis_client.add_to_inverted_index(1, ["hello", "world"])
         
         # Search with different cases
-        results_lower = redis_client.search_inverted_index(["hello"], "or")
-        results_upper = redis_client.search_inverted_index(["HELLO"], "or")
-        results_mixed = redis_client.search_inverted_index(["HeLLo"], "or")
+        results_lower = await redis_client.search_inverted_index(["hello"], "or")
+        results_upper = await redis_client.search_inverted_index(["HELLO"], "or")
+        results_mixed = await redis_client.search_inverted_index(["HeLLo"], "or")
         
         # All should return the same result
         assert results_lower == results_upper == results_mixed
         assert 1 in results_lower
         
-        redis_client.clear_inverted_index()
+        # Repeated words in any case behave like the word once
+        assert await redis_client.search_inverted_index(["hello", "HELLO"], "and") == {1}
 
+
+class TestDefinitionLookup:
+    """Tests for the LRU -> Redis -> API definition lookup order."""
+    
+    async def test_definition_lookup_order(self, redis_client, monkeypatch):
+        """Test that definitions come from the LRU, then Redis, then the API."""
+        from collections import OrderedDict
+        from app import services
+        
+        if not await redis_client.is_available():
+            pytest.skip("Redis not available")
+        
+        api_calls = []
+        
+        async def fake_api(word):
+            api_calls.append(word)
+            return ["From the API"] if word == "hello" else None
+        
+        monkeypatch.setattr("app.services.fetch_word_definition_from_api", fake_api)
+        monkeypatch.setattr("app.services.get_redis_client", lambda: redis_client)
+        monkeypatch.setattr("app.services._definition_cache", OrderedDict())
+        key = f"{redis_client.DEFINITION_CACHE_PREFIX}hello"
+        await redis_client.client.delete(key)
+        
+        # Miss everywhere: the API result is cached in Redis and the LRU
+        assert await services.get_word_definition("hello") == ["From the API"]
+        assert await redis_client.get_cached_definition("hello") == ["From the API"]
+        assert api_calls == ["hello"]
+        
+        # LRU hit: Redis is not consulted
+        await redis_client.cache_definition("hello", ["From Redis"])
+        assert await services.get_word_definition("hello") == ["From the API"]
+        
+        # Expired LRU entry: falls through to Redis
+        services._definition_cache["hello"] = (0.0, ("Stale",))
+        assert await services.get_word_definition("hello") == ["From Redis"]
+        assert api_calls == ["hello"]
+        
+        # Words without definitions are not cached, so the API is asked again
+        assert await services.get_word_definition("missing") is None
+        assert await services.get_word_definition("missing") is None
+        assert api_calls == ["hello", "missing", "missing"]
+        
+        # Cleanup
+        await redis_client.client.delete(key)
+    
+    async def test_definitions_read_with_one_mget(self, redis_client, monkeypatch):
+        """Test that LRU misses are read from Redis with a single MGET."""
+        from collections import OrderedDict
+        from app import services
+        
+        if not await redis_client.is_available():
+            pytest.skip("Redis not available")
+        
+        async def fake_api(word):
+            return [f"{word} from the API"] if word != "missing" else None
+        
+        monkeypatch.setattr("app.services.fetch_word_definition_from_api", fake_api)
+        monkeypatch.setattr("app.services.get_redis_client", lambda: redis_client)
+        monkeypatch.setattr("app.services._definition_cache", OrderedDict())
+        words = ["alpha", "beta", "gamma", "missing"]
+        keys = [f"{redis_client.DEFINITION_CACHE_PREFIX}{word}" for word in words]
+        await redis_client.client.delete(*keys)
+        await redis_client.cache_definitions({
+            "alpha": ["alpha from Redis"],
+            "beta": ["beta from Redis"],
+        })
+        
+        mget_calls = []
+        mget = redis_client.client.mget
+        
+        async def counting_mget(*args, **kwargs):
+            mget_calls.append(args)
+            return await mget(*args, **kwargs)
+        
+        monkeypatch.setattr(redis_client.client, "mget", counting_mget)
+        
+        assert await services.get_word_definitions(words) == [
+            ["alpha from Redis"], ["beta from Redis"], ["gamma from the API"], None
+        ]
+        assert len(mget_calls) == 1
+        assert await redis_client.get_cached_definition("gamma") == ["gamma from the API"]
+        
+        # Cleanup
+        await redis_client.client.delete(*keys)